@@ -1,91 +1,298 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import sqlite3
+import hashlib
+import hmac
 from datetime import datetime
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
+from reportlab.lib.rl_accel import escapePDF
+import itertools
+import math
 import os
 import sys
 import io
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 # Fix Windows console encoding for print statements
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+# SQLite database file, created next to the script's working directory
+DB_FILE = 'bank_system.db'
+
+# SQL statements, defined once so sqlite3's prepared-statement cache
+# always sees the same string for each query
+SQL_REGISTER = """INSERT INTO users (full_name, email, phone, password, balance_cents) 
+                  VALUES (?, ?, ?, ?, ?)"""
+SQL_LOGIN = "SELECT account_number, full_name, balance_cents, password FROM users WHERE email = ?"
+SQL_UPDATE_PASSWORD = "UPDATE users SET password = ? WHERE account_number = ?"
+SQL_DEPOSIT = "UPDATE users SET balance_cents = balance_cents + ? WHERE account_number = ? RETURNING balance_cents"
+SQL_WITHDRAW = """UPDATE users SET balance_cents = balance_cents - ? 
+                  WHERE account_number = ? AND balance_cents >= ? RETURNING balance_cents"""
+# Fallbacks for SQLite older than 3.35, which has no RETURNING clause
+SQL_DEPOSIT_DELTA = "UPDATE users SET balance_cents = balance_cents + ? WHERE account_number = ?"
+SQL_WITHDRAW_DELTA = "UPDATE users SET balance_cents = balance_cents - ? WHERE account_number = ?"
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+SQL_GET_BALANCE = "SELECT balance_cents FROM users WHERE account_number = ?"
+SQL_INSERT_TXN = """INSERT INTO transactions (account_number, transaction_type, amount_cents, balance_after_cents) 
+                    VALUES (?, ?, ?, ?)"""
+SQL_HISTORY = """SELECT transaction_type, amount_cents, balance_after_cents, transaction_date 
+                 FROM transactions WHERE account_number = ? 
+                 ORDER BY transaction_date DESC, transaction_id DESC
+                 LIMIT ? OFFSET ?"""
+# Full history for the PDF statement, with dates already rendered as text by SQLite
+SQL_STATEMENT_ROWS = """SELECT transaction_type, amount_cents, balance_after_cents, 
+                        strftime('%Y-%m-%d %H:%M:%S', transaction_date) 
+                        FROM transactions WHERE account_number = ? 
+                        ORDER BY transaction_date DESC, transaction_id DESC"""
+# Covers the history queries' WHERE + ORDER BY; transaction_id breaks ties
+# between rows written in the same second, so pages stay newest first
+SQL_CREATE_HISTORY_INDEX = """CREATE INDEX idx_txn_acct_date
+                              ON transactions(account_number, transaction_date DESC, transaction_id DESC)"""
+
+# Columns declared TIMESTAMP come back from the read connection as datetime
+# objects (CURRENT_TIMESTAMP stores 'YYYY-MM-DD HH:MM:SS' text)
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
+# Rows shown per page on the transaction history screen
+HISTORY_PAGE_SIZE = 100
+
+# Rows pulled from SQLite per fetchmany() call when streaming the full history
+HISTORY_FETCH_SIZE = 1000
+
+# PDF statement table layout: x offset of each column and the line's right edge.
+# Rows are set in Courier 10, which advances STATEMENT_CHAR_WIDTH points per
+# character, so the offsets sit on whole characters from the first column.
+# The money columns are 24 characters wide: room for amounts up to
+# MAX_AMOUNT_CENTS plus a one-space gutter
+STATEMENT_COLUMNS = (("Type", 50), ("Amount", 146), ("Balance After", 290), ("Date", 434))
+STATEMENT_RIGHT_EDGE = 550
+STATEMENT_CHAR_WIDTH = 6
+# Courier is a standard PDF font with WinAnsiEncoding (cp1252); characters
+# outside it are written as '?'
+STATEMENT_ENCODING = "cp1252"
+
+# Timestamp formats for the statement's file name and "Generated" line
+STATEMENT_FILE_STAMP = "%Y%m%d_%H%M%S"
+STATEMENT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Row baselines: continuation pages put the table header at STATEMENT_TOP_Y
+# and no row is drawn below STATEMENT_BOTTOM_Y
+STATEMENT_TOP_Y = 750
+STATEMENT_BOTTOM_Y = 50
+STATEMENT_ROW_HEIGHT = 20
+
+# Table definitions, shared by setup_database and the legacy-schema rebuild
+USERS_COLUMNS = """
+    account_number INTEGER PRIMARY KEY AUTOINCREMENT,
+    full_name TEXT NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    phone TEXT NOT NULL,
+    password TEXT NOT NULL,
+    balance_cents INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+"""
+TRANSACTIONS_COLUMNS = """
+    transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    account_number INTEGER NOT NULL,
+    transaction_type TEXT NOT NULL,
+    amount_cents INTEGER NOT NULL,
+    balance_after_cents INTEGER NOT NULL,
+    transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (account_number) REFERENCES users(account_number)
+"""
+
+
+# Largest amount accepted from the GUI, in paise (Rs 1,00,000 crore); keeps
+# entries like 1e400 or inf out of SQLite's 64-bit INTEGER columns
+MAX_AMOUNT_CENTS = 10 ** 14
+
+
+def to_cents(amount):
+    """Convert a rupee amount entered in the GUI to integer paise (ValueError if out of range)"""
+    if not math.isfinite(amount) or abs(amount) * 100 > MAX_AMOUNT_CENTS:
+        raise ValueError(f"Amount out of range: {amount}")
+    return int(round(amount * 100))
+
+
+def format_money(cents):
+    """Format integer paise for display, e.g. 'Rs 1,234.50'"""
+    return f"Rs {cents / 100:,.2f}"
+
+
+# scrypt cost parameters for stored password hashes
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 14, 8, 1
+
+
+def hash_password(password):
+    """Return a salted scrypt hash as 'scrypt$<salt hex>$<hash hex>'"""
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+    return f"scrypt${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password, stored):
+    """Check a password against a stored hash (or a legacy plaintext value)"""
+    if not stored.startswith("scrypt$"):
+        return hmac.compare_digest(password.encode(), stored.encode())
+    _, salt_hex, digest_hex = stored.split("$")
+    digest = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt_hex),
+                            n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+    return hmac.compare_digest(digest, bytes.fromhex(digest_hex))
+
+
 class BankManagementSystem:
     def __init__(self):
-        self.conn = None
+        self.conn_rw = None
+        self.conn_ro = None
         self.cursor = None
+        # Serializes writers on conn_rw, which threads may share
+        self.write_lock = threading.Lock()
+        # Per-thread read connections for background workers (see worker_connection)
+        self.worker_local = threading.local()
         self.setup_database()
         
     def setup_database(self):
         """Connect to SQLite and create tables if they don't exist"""
         try:
-            # Connect to SQLite database (creates file if doesn't exist)
-            self.conn = sqlite3.connect('bank_system.db')
-            self.cursor = self.conn.cursor()
+            # Read-write connection for mutations (creates file if doesn't exist).
+            # Autocommit mode: write paths issue BEGIN IMMEDIATE/COMMIT themselves
+            # so they take the write lock up front and wait on busy_timeout.
+            self.conn_rw = sqlite3.connect(DB_FILE, isolation_level=None,
+                                           cached_statements=256, check_same_thread=False)
+            self.cursor = self.conn_rw.cursor()
+            
+            # WAL journal keeps commits cheap and lets reads run during writes.
+            # Note: WAL creates bank_system.db-wal and bank_system.db-shm
+            # sidecar files next to the database; keep them with the .db file.
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+            self.cursor.execute("PRAGMA temp_store=MEMORY")
+            self.cursor.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+            self.cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+            self.cursor.execute("PRAGMA busy_timeout=5000")
             
             # Create users table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    account_number INTEGER PRIMARY KEY AUTOINCREMENT,
-                    full_name TEXT NOT NULL,
-                    email TEXT UNIQUE NOT NULL,
-                    phone TEXT NOT NULL,
-                    password TEXT NOT NULL,
-                    balance REAL DEFAULT 0.00,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            self.cursor.execute(f"CREATE TABLE IF NOT EXISTS users ({USERS_COLUMNS})")
             
             # Create transactions table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS transactions (
-                    transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    account_number INTEGER NOT NULL,
-                    transaction_type TEXT NOT NULL,
-                    amount REAL NOT NULL,
-                    balance_after REAL NOT NULL,
-                    transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (account_number) REFERENCES users(account_number)
-                )
-            """)
-            
-            self.conn.commit()
+            self.cursor.execute(f"CREATE TABLE IF NOT EXISTS transactions ({TRANSACTIONS_COLUMNS})")
+            
+            # Bring databases created with REAL money columns up to date
+            self.migrate_to_cents()
+            
+            # History index (users.email is already indexed through its UNIQUE
+            # constraint); rebuilt when missing or left over from an older definition
+            self.cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND name = 'idx_txn_acct_date'")
+            index = self.cursor.fetchone()
+            if index is None or index[0] != SQL_CREATE_HISTORY_INDEX:
+                self.cursor.execute("DROP INDEX IF EXISTS idx_txn_acct_date")
+                self.cursor.execute(SQL_CREATE_HISTORY_INDEX)
+                
+                # Gather planner statistics once, when the index is new; ANALYZE
+                # scans every table, so it is not repeated on each launch
+                self.cursor.execute("ANALYZE")
+            
+            # Long-lived read-only connection for lookups; under WAL its reads
+            # never wait on the write connection's commits
+            self.conn_ro = self.open_read_connection()
+            self.conn_ro.row_factory = sqlite3.Row
+            
             print("[OK] Database setup successful!")
             
         except sqlite3.Error as err:
             messagebox.showerror("Database Error", f"Error: {err}")
             
-    def register_user(self, full_name, email, phone, password, initial_deposit):
-        """Register a new user"""
-        try:
-            query = """INSERT INTO users (full_name, email, phone, password, balance) 
-                       VALUES (?, ?, ?, ?, ?)"""
-            self.cursor.execute(query, (full_name, email, phone, password, initial_deposit))
-            self.conn.commit()
+    @contextmanager
+    def write_transaction(self):
+        """Hold write_lock and run the block in one BEGIN IMMEDIATE transaction"""
+        # Commits when the block finishes; any exception, not just sqlite3.Error
+        # (e.g. an int too large to bind), rolls back so SQLite's write lock is
+        # never left held
+        with self.write_lock:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.cursor
+                self.conn_rw.commit()
+            finally:
+                if self.conn_rw.in_transaction:
+                    self.conn_rw.rollback()
+            
+    def migrate_to_cents(self):
+        """Move REAL rupee columns from older databases to INTEGER paise"""
+        user_columns = [row[1] for row in self.cursor.execute("PRAGMA table_info(users)")]
+        if 'balance_cents' in user_columns:
+            return
+        
+        # Rebuild both tables rather than ALTER TABLE ... DROP COLUMN, which
+        # needs SQLite 3.35+; the whole swap commits or rolls back as one
+        with self.write_transaction():
+            self.cursor.execute(f"CREATE TABLE users_new ({USERS_COLUMNS})")
+            self.cursor.execute("""INSERT INTO users_new (account_number, full_name, email, phone, 
+                                                          password, balance_cents, created_at)
+                                   SELECT account_number, full_name, email, phone, password, 
+                                          CAST(ROUND(balance * 100) AS INTEGER), created_at
+                                   FROM users""")
+            self.cursor.execute("DROP TABLE users")
+            self.cursor.execute("ALTER TABLE users_new RENAME TO users")
             
-            # Get the account number
-            account_number = self.cursor.lastrowid
+            self.cursor.execute(f"CREATE TABLE transactions_new ({TRANSACTIONS_COLUMNS})")
+            self.cursor.execute("""INSERT INTO transactions_new (transaction_id, account_number, transaction_type, 
+                                                                 amount_cents, balance_after_cents, transaction_date)
+                                   SELECT transaction_id, account_number, transaction_type, 
+                                          CAST(ROUND(amount * 100) AS INTEGER), 
+                                          CAST(ROUND(balance_after * 100) AS INTEGER), transaction_date
+                                   FROM transactions""")
+            self.cursor.execute("DROP TABLE transactions")
+            self.cursor.execute("ALTER TABLE transactions_new RENAME TO transactions")
             
-            # Record initial deposit as transaction if > 0
-            if initial_deposit > 0:
-                self.record_transaction(account_number, 'Deposit', initial_deposit, initial_deposit)
+        print("[OK] Migrated balances to integer paise")
             
-            return account_number
+    def register_user(self, full_name, email, phone, password, initial_deposit):
+        """Register a new user"""
+        # Hash outside the lock so other writers aren't held up by scrypt
+        password_hash = hash_password(password)
+        try:
+            with self.write_transaction():
+                # User row and initial deposit are committed together
+                self.cursor.execute(SQL_REGISTER, (full_name, email, phone, password_hash, initial_deposit))
+                
+                # Get the account number
+                account_number = self.cursor.lastrowid
+                
+                # Record initial deposit as transaction if > 0
+                if initial_deposit > 0:
+                    self.record_transaction(account_number, 'Deposit', initial_deposit, initial_deposit)
+                
+                return account_number
         except sqlite3.IntegrityError:
             return None
         except sqlite3.Error as err:
+            # Shown only once write_lock is released: the modal dialog runs a
+            # nested Tk event loop, and a writer reached from it would deadlock
             messagebox.showerror("Error", f"Registration failed: {err}")
             return None
             
     def login_user(self, email, password):
-        """Authenticate user login"""
+        """Authenticate user login; returns account_number, full_name and balance_cents as a dict, or None"""
         try:
-            query = "SELECT account_number, full_name, balance FROM users WHERE email = ? AND password = ?"
-            self.cursor.execute(query, (email, password))
-            result = self.cursor.fetchone()
-            return result
+            # Single indexed lookup on email; the hash is checked in Python
+            result = self.conn_ro.execute(SQL_LOGIN, (email,)).fetchone()
+            if result is None or not verify_password(password, result['password']):
+                return None
+            
+            # Upgrade accounts created before passwords were hashed
+            if not result['password'].startswith("scrypt$"):
+                password_hash = hash_password(password)
+                with self.write_lock:
+                    self.cursor.execute(SQL_UPDATE_PASSWORD, (password_hash, result['account_number']))
+            
+            # The stored hash never leaves this method
+            return {key: result[key] for key in ('account_number', 'full_name', 'balance_cents')}
         except sqlite3.Error as err:
             messagebox.showerror("Error", f"Login failed: {err}")
             return None
@@ -93,19 +300,21 @@ class BankManagementSystem:
     def deposit_money(self, account_number, amount):
         """Deposit money into account"""
         try:
-            # Update balance
-            query = "UPDATE users SET balance = balance + ? WHERE account_number = ?"
-            self.cursor.execute(query, (amount, account_number))
-            
-            # Get new balance
-            self.cursor.execute("SELECT balance FROM users WHERE account_number = ?", (account_number,))
-            new_balance = self.cursor.fetchone()[0]
-            
-            # Record transaction
-            self.record_transaction(account_number, 'Deposit', amount, new_balance)
-            
-            self.conn.commit()
-            return new_balance
+            with self.write_transaction():
+                if HAS_RETURNING:
+                    # Update balance and read it back in one statement
+                    self.cursor.execute(SQL_DEPOSIT, (amount, account_number))
+                    new_balance = self.cursor.fetchone()[0]
+                else:
+                    # Read the balance once and compute the new one here
+                    self.cursor.execute(SQL_GET_BALANCE, (account_number,))
+                    new_balance = self.cursor.fetchone()[0] + amount
+                    self.cursor.execute(SQL_DEPOSIT_DELTA, (amount, account_number))
+                
+                # Record transaction
+                self.record_transaction(account_number, 'Deposit', amount, new_balance)
+                
+                return new_balance
         except sqlite3.Error as err:
             messagebox.showerror("Error", f"Deposit failed: {err}")
             return None
@@ -113,25 +322,27 @@ class BankManagementSystem:
     def withdraw_money(self, account_number, amount):
         """Withdraw money from account"""
         try:
-            # Check current balance
-            self.cursor.execute("SELECT balance FROM users WHERE account_number = ?", (account_number,))
-            current_balance = self.cursor.fetchone()[0]
-            
-            if current_balance < amount:
-                return None, "Insufficient funds"
-            
-            # Update balance
-            query = "UPDATE users SET balance = balance - ? WHERE account_number = ?"
-            self.cursor.execute(query, (amount, account_number))
-            
-            # Get new balance
-            new_balance = current_balance - amount
-            
-            # Record transaction
-            self.record_transaction(account_number, 'Withdrawal', amount, new_balance)
-            
-            self.conn.commit()
-            return new_balance, "Success"
+            with self.write_transaction():
+                if HAS_RETURNING:
+                    # Only touches the row when funds suffice; no row back means insufficient funds
+                    self.cursor.execute(SQL_WITHDRAW, (amount, account_number, amount))
+                    row = self.cursor.fetchone()
+                    new_balance = row[0] if row else None
+                else:
+                    # Read the balance once and compute the new one here
+                    self.cursor.execute(SQL_GET_BALANCE, (account_number,))
+                    current_balance = self.cursor.fetchone()[0]
+                    new_balance = current_balance - amount if current_balance >= amount else None
+                    if new_balance is not None:
+                        self.cursor.execute(SQL_WITHDRAW_DELTA, (amount, account_number))
+                
+                if new_balance is None:
+                    return None, "Insufficient funds"
+                
+                # Record transaction
+                self.record_transaction(account_number, 'Withdrawal', amount, new_balance)
+                
+                return new_balance, "Success"
         except sqlite3.Error as err:
             messagebox.showerror("Error", f"Withdrawal failed: {err}")
             return None, str(err)
@@ -139,33 +350,79 @@ class BankManagementSystem:
     def get_balance(self, account_number):
         """Get current balance"""
         try:
-            query = "SELECT balance FROM users WHERE account_number = ?"
-            self.cursor.execute(query, (account_number,))
-            return self.cursor.fetchone()[0]
+            return self.conn_ro.execute(SQL_GET_BALANCE, (account_number,)).fetchone()[0]
         except sqlite3.Error as err:
             messagebox.showerror("Error", f"Failed to fetch balance: {err}")
             return None
             
     def record_transaction(self, account_number, trans_type, amount, balance_after):
-        """Record a transaction"""
+        """Record a transaction (caller owns the BEGIN/COMMIT)"""
         try:
-            query = """INSERT INTO transactions (account_number, transaction_type, amount, balance_after) 
-                       VALUES (?, ?, ?, ?)"""
-            self.cursor.execute(query, (account_number, trans_type, amount, balance_after))
+            self.cursor.execute(SQL_INSERT_TXN, (account_number, trans_type, amount, balance_after))
         except sqlite3.Error as err:
+            # Re-raise so the caller rolls back its whole transaction
             print(f"Transaction recording failed: {err}")
+            raise
+            
+    def record_transactions_bulk(self, rows):
+        """Insert (account_number, type, amount_cents, balance_after_cents) rows in one transaction"""
+        # For seeding and imports: only history rows are written, balances are left alone
+        try:
+            with self.write_transaction():
+                self.cursor.executemany(SQL_INSERT_TXN, rows)
+                return True
+        except sqlite3.Error as err:
+            print(f"Bulk transaction recording failed: {err}")
+            return False
             
-    def get_transaction_history(self, account_number):
-        """Get transaction history"""
+    def get_transaction_history(self, account_number, limit=HISTORY_PAGE_SIZE, offset=0):
+        """Get one page of transaction history, newest first (limit=-1 for all rows)"""
         try:
-            query = """SELECT transaction_type, amount, balance_after, transaction_date 
-                       FROM transactions WHERE account_number = ? 
-                       ORDER BY transaction_date DESC"""
-            self.cursor.execute(query, (account_number,))
-            return self.cursor.fetchall()
+            return self.conn_ro.execute(SQL_HISTORY, (account_number, limit, offset)).fetchall()
         except sqlite3.Error as err:
             messagebox.showerror("Error", f"Failed to fetch transactions: {err}")
             return []
+            
+    def open_read_connection(self):
+        """Open a read-only connection with the read-side pragmas applied"""
+        conn = sqlite3.connect(f"file:{DB_FILE}?mode=ro", uri=True, isolation_level=None,
+                               check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES)
+        for pragma in ("temp_store=MEMORY", "cache_size=-20000",
+                       "mmap_size=268435456", "busy_timeout=5000"):
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
+        
+    def worker_connection(self):
+        """Return the calling thread's own long-lived read connection, opening it on first use"""
+        # A cursor left open between fetchmany() batches holds a WAL read
+        # snapshot on its connection, so a long export must not share conn_ro
+        # with the UI thread or the UI would stop seeing new commits
+        if not hasattr(self.worker_local, 'conn'):
+            self.worker_local.conn = self.open_read_connection()
+        return self.worker_local.conn
+        
+    def get_transaction_history_iter(self, account_number):
+        """Yield every transaction, newest first, with its date as display text"""
+        # Runs on the export worker, on that thread's own read connection;
+        # rows cross the driver boundary in batches rather than one at a time
+        cur = self.worker_connection().execute(SQL_STATEMENT_ROWS, (account_number,))
+        while True:
+            rows = cur.fetchmany(HISTORY_FETCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+
+
+# Named Tk fonts shared by every widget, keyed by (size, weight)
+FONT_CACHE = {}
+
+
+def ui_font(size, weight="normal"):
+    """Return a cached Segoe UI font so widgets reuse one Tk font handle"""
+    key = (size, weight)
+    if key not in FONT_CACHE:
+        FONT_CACHE[key] = tkfont.Font(family="Segoe UI", size=size, weight=weight)
+    return FONT_CACHE[key]
 
 
 class ModernButton(tk.Canvas):
@@ -187,7 +444,7 @@ class ModernButton(tk.Canvas):
         self.button_id = self.create_rectangle(0, 0, width, height, fill=bg_color, 
                                                outline="", tags="button")
         self.text_id = self.create_text(width/2, height/2, text=text, fill=fg_color, 
-                                       font=("Segoe UI", 11, "bold"), tags="button")
+                                       font=ui_font(11, "bold"), tags="button")
         
         # Bind events
         self.tag_bind("button", "<Enter>", self.on_enter)
@@ -212,7 +469,7 @@ class ModernEntry(tk.Frame):
     def __init__(self, parent, placeholder="", show=None, **kwargs):
         super().__init__(parent, bg=parent['bg'])
         
-        self.entry = tk.Entry(self, font=("Segoe UI", 11), relief="flat", 
+        self.entry = tk.Entry(self, font=ui_font(11), relief="flat", 
                              bg="#f5f5f5", fg="#333", insertbackground="#333",
                              show=show, **kwargs)
         self.entry.pack(fill="x", ipady=8, ipadx=10)
@@ -251,13 +508,47 @@ class BankGUI:
         self.bank_system = BankManagementSystem()
         self.current_user = None
         
+        # Statement exports run one at a time on a single worker thread, which
+        # opens its own read connection when it starts
+        self.export_executor = ThreadPoolExecutor(max_workers=1,
+                                                  initializer=self.bank_system.worker_connection)
+        # Submitted exports that have not finished yet, so close() can cancel them
+        self.pending_exports = set()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Every screen is built once and stacked in the same grid cell;
+        # navigation raises the wanted screen instead of rebuilding it
+        self.root.rowconfigure(0, weight=1)
+        self.root.columnconfigure(0, weight=1)
+        self.amount_entries = {}
+        self.screens = {
+            'login': self.build_login_screen(),
+            'register': self.build_register_screen(),
+            'dashboard': self.build_dashboard(),
+            'Deposit': self.build_transaction_screen("Deposit", self.success_color),
+            'Withdraw': self.build_transaction_screen("Withdraw", self.warning_color),
+            'history': self.build_transaction_history(),
+        }
+        
         # Show login screen initially
         self.show_login_screen()
         
-    def clear_screen(self):
-        """Clear all widgets from screen"""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def new_screen(self):
+        """Create a full-window frame in the shared screen stack"""
+        screen = tk.Frame(self.root, bg=self.bg_color)
+        screen.grid(row=0, column=0, sticky="nsew")
+        return screen
+        
+    def raise_screen(self, name):
+        """Bring a prebuilt screen to the front"""
+        self.screens[name].tkraise()
+        # Take keyboard focus with it, so typing can't land in a hidden entry
+        self.screens[name].focus_set()
+        
+    def clear_entries(self, entries):
+        """Empty the given form entries"""
+        for entry in entries:
+            entry.delete(0, "end")
             
     def create_card(self, parent, **kwargs):
         """Create a modern card-style frame"""
@@ -267,25 +558,30 @@ class BankGUI:
         
     def show_login_screen(self):
         """Display modern login screen"""
-        self.clear_screen()
+        self.clear_entries(self.login_entries)
+        self.raise_screen('login')
+        
+    def build_login_screen(self):
+        """Build the login screen"""
+        screen = self.new_screen()
         
         # Left side - Branding
-        left_frame = tk.Frame(self.root, bg="#1a73e8")
+        left_frame = tk.Frame(screen, bg="#1a73e8")
         left_frame.place(x=0, y=0, relwidth=0.45, relheight=1)
         
         branding = tk.Frame(left_frame, bg="#1a73e8")
         branding.place(relx=0.5, rely=0.5, anchor="center")
         
-        tk.Label(branding, text="BANK", font=("Segoe UI", 48, "bold"), 
+        tk.Label(branding, text="BANK", font=ui_font(48, "bold"), 
                 bg="#1a73e8", fg="white").pack()
-        tk.Label(branding, text="Management System", font=("Segoe UI", 16), 
+        tk.Label(branding, text="Management System", font=ui_font(16), 
                 bg="#1a73e8", fg="#bbdefb").pack()
         
-        tk.Label(branding, text="Secure • Fast • Reliable", font=("Segoe UI", 11), 
+        tk.Label(branding, text="Secure • Fast • Reliable", font=ui_font(11), 
                 bg="#1a73e8", fg="#90caf9", pady=30).pack()
         
         # Right side - Login form
-        right_frame = tk.Frame(self.root, bg=self.bg_color)
+        right_frame = tk.Frame(screen, bg=self.bg_color)
         right_frame.place(relx=0.45, y=0, relwidth=0.55, relheight=1)
         
         login_container = tk.Frame(right_frame, bg=self.bg_color)
@@ -298,23 +594,24 @@ class BankGUI:
         content = tk.Frame(login_card, bg=self.card_bg, padx=50, pady=40)
         content.pack()
         
-        tk.Label(content, text="Welcome Back", font=("Segoe UI", 24, "bold"), 
+        tk.Label(content, text="Welcome Back", font=ui_font(24, "bold"), 
                 bg=self.card_bg, fg="#202124").pack(anchor="w", pady=(0, 5))
         
-        tk.Label(content, text="Login to your account", font=("Segoe UI", 11), 
+        tk.Label(content, text="Login to your account", font=ui_font(11), 
                 bg=self.card_bg, fg="#5f6368").pack(anchor="w", pady=(0, 30))
         
         # Email field
-        tk.Label(content, text="Email Address", font=("Segoe UI", 10), 
+        tk.Label(content, text="Email Address", font=ui_font(10), 
                 bg=self.card_bg, fg="#5f6368").pack(anchor="w", pady=(0, 5))
         email_entry = ModernEntry(content, width=35)
         email_entry.pack(fill="x", pady=(0, 20))
         
         # Password field
-        tk.Label(content, text="Password", font=("Segoe UI", 10), 
+        tk.Label(content, text="Password", font=ui_font(10), 
                 bg=self.card_bg, fg="#5f6368").pack(anchor="w", pady=(0, 5))
         password_entry = ModernEntry(content, show="*", width=35)
         password_entry.pack(fill="x", pady=(0, 30))
+        self.login_entries = (email_entry, password_entry)
         
         def login():
             email = email_entry.get().strip()
@@ -325,14 +622,15 @@ class BankGUI:
                 return
                 
             user = self.bank_system.login_user(email, password)
+            # The login screen stays built for the whole session, so don't
+            # leave the password (or, once signed in, the email) sitting in it
             if user:
-                self.current_user = {
-                    'account_number': user[0],
-                    'name': user[1],
-                    'balance': user[2]
-                }
+                self.clear_entries(self.login_entries)
+                # A fresh dict keyed by column name, so the cached balance can be updated
+                self.current_user = user
                 self.show_dashboard()
             else:
+                self.clear_entries((password_entry,))
                 messagebox.showerror("Login Failed", "Invalid email or password")
         
         # Login button
@@ -343,33 +641,40 @@ class BankGUI:
         register_frame = tk.Frame(content, bg=self.card_bg)
         register_frame.pack()
         
-        tk.Label(register_frame, text="Don't have an account?", font=("Segoe UI", 10), 
+        tk.Label(register_frame, text="Don't have an account?", font=ui_font(10), 
                 bg=self.card_bg, fg="#5f6368").pack(side="left", padx=(0, 5))
         
-        register_btn = tk.Label(register_frame, text="Create Account", font=("Segoe UI", 10, "bold"), 
+        register_btn = tk.Label(register_frame, text="Create Account", font=ui_font(10, "bold"), 
                                bg=self.card_bg, fg=self.primary_color, cursor="hand2")
         register_btn.pack(side="left")
         register_btn.bind("<Button-1>", lambda e: self.show_register_screen())
         
+        return screen
+        
     def show_register_screen(self):
         """Display modern registration screen"""
-        self.clear_screen()
+        self.clear_entries(self.register_entries.values())
+        self.raise_screen('register')
+        
+    def build_register_screen(self):
+        """Build the registration screen"""
+        screen = self.new_screen()
         
         # Header
-        header = tk.Frame(self.root, bg=self.card_bg, height=70)
+        header = tk.Frame(screen, bg=self.card_bg, height=70)
         header.pack(fill="x")
         header.pack_propagate(False)
         
-        tk.Label(header, text="Create New Account", font=("Segoe UI", 20, "bold"), 
+        tk.Label(header, text="Create New Account", font=ui_font(20, "bold"), 
                 bg=self.card_bg, fg="#202124").pack(side="left", padx=30, pady=20)
         
-        back_btn = tk.Label(header, text="< Back to Login", font=("Segoe UI", 10), 
+        back_btn = tk.Label(header, text="< Back to Login", font=ui_font(10), 
                            bg=self.card_bg, fg=self.primary_color, cursor="hand2")
         back_btn.pack(side="right", padx=30)
         back_btn.bind("<Button-1>", lambda e: self.show_login_screen())
         
         # Main content
-        content = tk.Frame(self.root, bg=self.bg_color)
+        content = tk.Frame(screen, bg=self.bg_color)
         content.pack(fill="both", expand=True, padx=50, pady=30)
         
         # Registration card
@@ -390,11 +695,12 @@ class BankGUI:
         
         entries = {}
         for label, field_type in fields:
-            tk.Label(form, text=label, font=("Segoe UI", 10), 
+            tk.Label(form, text=label, font=ui_font(10), 
                     bg=self.card_bg, fg="#5f6368").pack(anchor="w", pady=(10, 5))
             entry = ModernEntry(form, show="*" if field_type == "password" else None, width=40)
             entry.pack(fill="x", pady=(0, 10))
             entries[label] = entry
+        self.register_entries = entries
         
         def register():
             full_name = entries["Full Name"].get().strip()
@@ -408,31 +714,45 @@ class BankGUI:
                 return
                 
             try:
-                initial_deposit = float(initial_deposit)
+                initial_deposit = to_cents(float(initial_deposit))
                 if initial_deposit < 0:
                     messagebox.showwarning("Invalid Amount", "Initial deposit cannot be negative")
                     return
-            except ValueError:
+            except (ValueError, OverflowError):
                 messagebox.showwarning("Invalid Amount", "Please enter a valid amount")
                 return
                 
             account_number = self.bank_system.register_user(full_name, email, phone, password, initial_deposit)
             
+            # As with login, the form is emptied once it has been used: all of
+            # it on success, just the password when registration fails
             if account_number:
+                self.clear_entries(entries.values())
                 messagebox.showinfo("Success", f"Account created successfully!\nYour Account Number: {account_number}")
                 self.show_login_screen()
             else:
+                self.clear_entries((entries["Password"],))
                 messagebox.showerror("Registration Failed", "Email already exists or registration failed")
         
         ModernButton(form, "Create Account", register, bg_color=self.success_color, 
                     hover_color="#2d8e47", width=350, height=45).pack(pady=(20, 0))
         
+        return screen
+        
     def show_dashboard(self):
         """Display modern dashboard"""
-        self.clear_screen()
+        # Balance is fetched at login and kept current by process_transaction
+        self.welcome_label.config(text=f"Welcome, {self.current_user['full_name']}")
+        self.account_label.config(text=f"A/C: {self.current_user['account_number']}")
+        self.balance_label.config(text=format_money(self.current_user['balance_cents']))
+        self.raise_screen('dashboard')
+        
+    def build_dashboard(self):
+        """Build the dashboard; user details are filled in by show_dashboard"""
+        screen = self.new_screen()
         
         # Top Navigation Bar
-        navbar = tk.Frame(self.root, bg=self.card_bg, height=70)
+        navbar = tk.Frame(screen, bg=self.card_bg, height=70)
         navbar.pack(fill="x")
         navbar.pack_propagate(False)
         
@@ -440,26 +760,26 @@ class BankGUI:
         logo_frame = tk.Frame(navbar, bg=self.card_bg)
         logo_frame.pack(side="left", padx=30, pady=15)
         
-        tk.Label(logo_frame, text="BANK", font=("Segoe UI", 16, "bold"), 
+        tk.Label(logo_frame, text="BANK", font=ui_font(16, "bold"), 
                 bg=self.card_bg, fg=self.primary_color).pack(side="left")
         
         # User info
         user_frame = tk.Frame(navbar, bg=self.card_bg)
         user_frame.pack(side="right", padx=30)
         
-        tk.Label(user_frame, text=f"Welcome, {self.current_user['name']}", 
-                font=("Segoe UI", 11), bg=self.card_bg, fg="#202124").pack(side="left", padx=(0, 20))
+        self.welcome_label = tk.Label(user_frame, font=ui_font(11), bg=self.card_bg, fg="#202124")
+        self.welcome_label.pack(side="left", padx=(0, 20))
         
-        tk.Label(user_frame, text=f"A/C: {self.current_user['account_number']}", 
-                font=("Segoe UI", 9), bg=self.card_bg, fg="#5f6368").pack(side="left", padx=(0, 20))
+        self.account_label = tk.Label(user_frame, font=ui_font(9), bg=self.card_bg, fg="#5f6368")
+        self.account_label.pack(side="left", padx=(0, 20))
         
-        logout_btn = tk.Label(user_frame, text="Logout", font=("Segoe UI", 10, "bold"), 
+        logout_btn = tk.Label(user_frame, text="Logout", font=ui_font(10, "bold"), 
                              bg=self.card_bg, fg=self.danger_color, cursor="hand2")
         logout_btn.pack(side="left")
         logout_btn.bind("<Button-1>", lambda e: self.show_login_screen())
         
         # Main content area
-        content = tk.Frame(self.root, bg=self.bg_color)
+        content = tk.Frame(screen, bg=self.bg_color)
         content.pack(fill="both", expand=True, padx=40, pady=30)
         
         # Balance Card
@@ -469,12 +789,12 @@ class BankGUI:
         balance_content = tk.Frame(balance_card, bg=self.card_bg, padx=40, pady=30)
         balance_content.pack(fill="x")
         
-        tk.Label(balance_content, text="Total Balance", font=("Segoe UI", 12), 
+        tk.Label(balance_content, text="Total Balance", font=ui_font(12), 
                 bg=self.card_bg, fg="#5f6368").pack(anchor="w")
         
-        balance = self.bank_system.get_balance(self.current_user['account_number'])
-        tk.Label(balance_content, text=f"Rs {balance:,.2f}", font=("Segoe UI", 36, "bold"), 
-                bg=self.card_bg, fg="#202124").pack(anchor="w", pady=(5, 0))
+        self.balance_label = tk.Label(balance_content, font=ui_font(36, "bold"), 
+                                      bg=self.card_bg, fg="#202124")
+        self.balance_label.pack(anchor="w", pady=(5, 0))
         
         # Action Cards
         actions_frame = tk.Frame(content, bg=self.bg_color)
@@ -504,42 +824,46 @@ class BankGUI:
             icon_canvas.pack(pady=(0, 15))
             icon_canvas.create_oval(10, 10, 50, 50, fill=color, outline="")
             
-            tk.Label(card_content, text=title, font=("Segoe UI", 16, "bold"), 
+            tk.Label(card_content, text=title, font=ui_font(16, "bold"), 
                     bg=self.card_bg, fg="#202124").pack()
             
-            tk.Label(card_content, text=subtitle, font=("Segoe UI", 10), 
+            tk.Label(card_content, text=subtitle, font=ui_font(10), 
                     bg=self.card_bg, fg="#5f6368", justify="center").pack(pady=(5, 20))
             
             ModernButton(card_content, "Open", command, bg_color=color, 
                         hover_color=color, width=150, height=40).pack()
         
+        return screen
+        
     def show_deposit_screen(self):
         """Display modern deposit screen"""
-        self.clear_screen()
-        self.create_transaction_screen("Deposit", self.success_color)
+        self.amount_entries["Deposit"].delete(0, "end")
+        self.raise_screen('Deposit')
         
     def show_withdraw_screen(self):
         """Display modern withdrawal screen"""
-        self.clear_screen()
-        self.create_transaction_screen("Withdraw", self.warning_color)
+        self.amount_entries["Withdraw"].delete(0, "end")
+        self.raise_screen('Withdraw')
+        
+    def build_transaction_screen(self, trans_type, color):
+        """Build a modern transaction screen for Deposit or Withdraw"""
+        screen = self.new_screen()
         
-    def create_transaction_screen(self, trans_type, color):
-        """Create modern transaction screen"""
         # Header
-        header = tk.Frame(self.root, bg=self.card_bg, height=70)
+        header = tk.Frame(screen, bg=self.card_bg, height=70)
         header.pack(fill="x")
         header.pack_propagate(False)
         
-        tk.Label(header, text=f"{trans_type} Money", font=("Segoe UI", 20, "bold"), 
+        tk.Label(header, text=f"{trans_type} Money", font=ui_font(20, "bold"), 
                 bg=self.card_bg, fg="#202124").pack(side="left", padx=30, pady=20)
         
-        back_btn = tk.Label(header, text="< Back to Dashboard", font=("Segoe UI", 10), 
+        back_btn = tk.Label(header, text="< Back to Dashboard", font=ui_font(10), 
                            bg=self.card_bg, fg=self.primary_color, cursor="hand2")
         back_btn.pack(side="right", padx=30)
         back_btn.bind("<Button-1>", lambda e: self.show_dashboard())
         
         # Main content
-        content = tk.Frame(self.root, bg=self.bg_color)
+        content = tk.Frame(screen, bg=self.bg_color)
         content.pack(fill="both", expand=True)
         
         # Transaction card
@@ -555,18 +879,19 @@ class BankGUI:
         icon_canvas.pack(pady=(0, 20))
         icon_canvas.create_oval(10, 10, 70, 70, fill=color, outline="")
         
-        tk.Label(form, text=f"{trans_type} Amount", font=("Segoe UI", 20, "bold"), 
+        tk.Label(form, text=f"{trans_type} Amount", font=ui_font(20, "bold"), 
                 bg=self.card_bg, fg="#202124").pack(pady=(0, 30))
         
-        tk.Label(form, text="Enter Amount (Rs)", font=("Segoe UI", 10), 
+        tk.Label(form, text="Enter Amount (Rs)", font=ui_font(10), 
                 bg=self.card_bg, fg="#5f6368").pack(anchor="w", pady=(0, 5))
         
         amount_entry = ModernEntry(form, width=35)
         amount_entry.pack(fill="x", pady=(0, 30))
+        self.amount_entries[trans_type] = amount_entry
         
         def process_transaction():
             try:
-                amount = float(amount_entry.get().strip())
+                amount = to_cents(float(amount_entry.get().strip()))
                 if amount <= 0:
                     messagebox.showwarning("Invalid Amount", "Amount must be greater than 0")
                     return
@@ -574,48 +899,63 @@ class BankGUI:
                 if trans_type == "Deposit":
                     new_balance = self.bank_system.deposit_money(self.current_user['account_number'], amount)
                     if new_balance is not None:
-                        messagebox.showinfo("Success", f"Rs {amount:,.2f} deposited successfully!\nNew Balance: Rs {new_balance:,.2f}")
+                        self.current_user['balance_cents'] = new_balance
+                        messagebox.showinfo("Success", f"{format_money(amount)} deposited successfully!\nNew Balance: {format_money(new_balance)}")
                         self.show_dashboard()
                 else:  # Withdrawal
                     new_balance, message = self.bank_system.withdraw_money(self.current_user['account_number'], amount)
                     if new_balance is not None:
-                        messagebox.showinfo("Success", f"Rs {amount:,.2f} withdrawn successfully!\nNew Balance: Rs {new_balance:,.2f}")
+                        self.current_user['balance_cents'] = new_balance
+                        messagebox.showinfo("Success", f"{format_money(amount)} withdrawn successfully!\nNew Balance: {format_money(new_balance)}")
                         self.show_dashboard()
                     else:
                         messagebox.showerror("Transaction Failed", message)
                         
-            except ValueError:
+            except (ValueError, OverflowError):
                 messagebox.showwarning("Invalid Input", "Please enter a valid amount")
         
         ModernButton(form, f"Confirm {trans_type}", process_transaction, 
                     bg_color=color, hover_color=color, width=350, height=45).pack()
         
+        return screen
+        
     def show_transaction_history(self):
         """Display modern transaction history"""
-        self.clear_screen()
+        if self.load_history_page(0):
+            self.history_empty_label.place_forget()
+            self.history_pager.pack(side="bottom", fill="x", padx=20, pady=(0, 20), 
+                                    before=self.history_tree_frame)
+        else:
+            self.history_pager.pack_forget()
+            self.history_empty_label.place(relx=0.5, rely=0.5, anchor="center")
+        self.raise_screen('history')
+        
+    def build_transaction_history(self):
+        """Build the transaction history screen; rows are loaded by show_transaction_history"""
+        screen = self.new_screen()
         
         # Header
-        header = tk.Frame(self.root, bg=self.card_bg, height=70)
+        header = tk.Frame(screen, bg=self.card_bg, height=70)
         header.pack(fill="x")
         header.pack_propagate(False)
         
-        tk.Label(header, text="Transaction History", font=("Segoe UI", 20, "bold"), 
+        tk.Label(header, text="Transaction History", font=ui_font(20, "bold"), 
                 bg=self.card_bg, fg="#202124").pack(side="left", padx=30, pady=20)
         
         # Export button in header
-        export_btn = tk.Label(header, text="Export PDF", font=("Segoe UI", 10, "bold"), 
+        export_btn = tk.Label(header, text="Export PDF", font=ui_font(10, "bold"), 
                              bg=self.success_color, fg="white", cursor="hand2", 
                              padx=20, pady=8)
         export_btn.pack(side="right", padx=30)
         export_btn.bind("<Button-1>", lambda e: self.export_to_pdf())
         
-        back_btn = tk.Label(header, text="< Back to Dashboard", font=("Segoe UI", 10), 
+        back_btn = tk.Label(header, text="< Back to Dashboard", font=ui_font(10), 
                            bg=self.card_bg, fg=self.primary_color, cursor="hand2")
         back_btn.pack(side="right", padx=20)
         back_btn.bind("<Button-1>", lambda e: self.show_dashboard())
         
         # Main content
-        content = tk.Frame(self.root, bg=self.bg_color)
+        content = tk.Frame(screen, bg=self.bg_color)
         content.pack(fill="both", expand=True, padx=40, pady=30)
         
         # Table card
@@ -630,17 +970,34 @@ class BankGUI:
                        foreground="#202124",
                        fieldbackground=self.card_bg,
                        borderwidth=0,
-                       font=("Segoe UI", 10))
+                       font=ui_font(10))
         style.configure("Treeview.Heading",
                        background="#f8f9fa",
                        foreground="#202124",
                        borderwidth=0,
-                       font=("Segoe UI", 11, "bold"))
+                       font=ui_font(11, "bold"))
         style.map("Treeview", background=[("selected", self.primary_color)])
         
+        # Pagination controls (packed first so they keep their space at the bottom)
+        pager = tk.Frame(table_card, bg=self.card_bg)
+        pager.pack(side="bottom", fill="x", padx=20, pady=(0, 20))
+        
+        next_btn = tk.Label(pager, text="Next >", font=ui_font(10, "bold"), 
+                           bg=self.card_bg, fg=self.primary_color, cursor="hand2")
+        next_btn.pack(side="right")
+        
+        page_label = tk.Label(pager, font=ui_font(10), bg=self.card_bg, fg="#5f6368")
+        page_label.pack(side="right", padx=20)
+        
+        prev_btn = tk.Label(pager, text="< Prev", font=ui_font(10, "bold"), 
+                           bg=self.card_bg, fg=self.primary_color, cursor="hand2")
+        prev_btn.pack(side="right")
+        
         # Treeview
         tree_frame = tk.Frame(table_card, bg=self.card_bg)
         tree_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        self.history_pager = pager
+        self.history_tree_frame = tree_frame
         
         scrollbar = ttk.Scrollbar(tree_frame)
         scrollbar.pack(side="right", fill="y")
@@ -659,79 +1016,183 @@ class BankGUI:
         for col in columns:
             tree.heading(col, text=col)
         
-        # Fetch and display transactions
-        transactions = self.bank_system.get_transaction_history(self.current_user['account_number'])
-        
-        for trans in transactions:
-            trans_type, amount, balance_after, trans_date = trans
-            tree.insert("", "end", values=(
-                trans_type,
-                f"Rs {amount:,.2f}",
-                f"Rs {balance_after:,.2f}",
-                trans_date
-            ))
-        
         tree.pack(fill="both", expand=True)
         
-        if not transactions:
-            empty_label = tk.Label(tree_frame, text="No transactions yet", 
-                    font=("Segoe UI", 14), bg=self.card_bg, fg="#5f6368")
-            empty_label.place(relx=0.5, rely=0.5, anchor="center")
-    
-    def export_to_pdf(self):
-        """Export transaction history to PDF"""
-        try:
-            transactions = self.bank_system.get_transaction_history(self.current_user['account_number'])
-            
-            if not transactions:
-                messagebox.showinfo("No Data", "No transactions to export")
-                return
-            
-            # Create PDF
-            filename = f"statement_{self.current_user['account_number']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            c = canvas.Canvas(filename, pagesize=letter)
-            
-            # Header
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(200, 750, "Bank Transaction Statement")
-            
-            c.setFont("Helvetica", 12)
-            c.drawString(50, 720, f"Account Number: {self.current_user['account_number']}")
-            c.drawString(50, 700, f"Account Holder: {self.current_user['name']}")
-            c.drawString(50, 680, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            # Table header
-            y = 640
-            c.setFont("Helvetica-Bold", 10)
-            c.drawString(50, y, "Type")
-            c.drawString(150, y, "Amount")
-            c.drawString(250, y, "Balance After")
-            c.drawString(370, y, "Date")
-            
-            # Draw line
-            c.line(50, y-5, 550, y-5)
-            
-            # Transactions
-            c.setFont("Helvetica", 10)
-            y -= 25
+        page_state = {'page': 0, 'has_next': False}
+        
+        def load_page(page):
+            """Fetch one page of transactions and show it in the table"""
+            # Ask for one extra row to know whether a next page exists
+            transactions = self.bank_system.get_transaction_history(
+                self.current_user['account_number'], HISTORY_PAGE_SIZE + 1, page * HISTORY_PAGE_SIZE)
+            page_state['page'] = page
+            page_state['has_next'] = len(transactions) > HISTORY_PAGE_SIZE
+            transactions = transactions[:HISTORY_PAGE_SIZE]
             
+            # Unmap the tree and detach the scrollbar while rows go in, so Tk
+            # lays out and redraws once per page instead of once per row
+            tree.pack_forget()
+            tree.configure(yscrollcommand="")
+            tree.delete(*tree.get_children())
             for trans in transactions:
-                if y < 50:  # New page if needed
-                    c.showPage()
-                    y = 750
-                    
                 trans_type, amount, balance_after, trans_date = trans
-                c.drawString(50, y, trans_type)
-                c.drawString(150, y, f"Rs {amount:,.2f}")
-                c.drawString(250, y, f"Rs {balance_after:,.2f}")
-                c.drawString(370, y, str(trans_date))
-                y -= 20
+                tree.insert("", "end", values=(
+                    trans_type,
+                    format_money(amount),
+                    format_money(balance_after),
+                    trans_date
+                ))
+            tree.configure(yscrollcommand=scrollbar.set)
+            tree.pack(fill="both", expand=True)
+            tree.yview_moveto(0)
             
-            c.save()
-            messagebox.showinfo("Success", f"Statement exported successfully!\nSaved as: {filename}")
+            page_label.config(text=f"Page {page + 1}")
+            prev_btn.config(fg=self.primary_color if page > 0 else "#bdc1c6")
+            next_btn.config(fg=self.primary_color if page_state['has_next'] else "#bdc1c6")
+            return transactions
+        
+        def prev_page():
+            if page_state['page'] > 0:
+                load_page(page_state['page'] - 1)
+        
+        def next_page():
+            if page_state['has_next']:
+                load_page(page_state['page'] + 1)
+        
+        prev_btn.bind("<Button-1>", lambda e: prev_page())
+        next_btn.bind("<Button-1>", lambda e: next_page())
+        self.load_history_page = load_page
+        
+        # Shown instead of the pager when the account has no transactions
+        self.history_empty_label = tk.Label(tree_frame, text="No transactions yet", 
+                font=ui_font(14), bg=self.card_bg, fg="#5f6368")
+        
+        return screen
+    
+    def export_to_pdf(self):
+        """Export transaction history to PDF without blocking the UI"""
+        future = self.export_executor.submit(self.write_statement_pdf, 
+                                             self.current_user['account_number'], 
+                                             self.current_user['full_name'])
+        self.pending_exports.add(future)
+        future.add_done_callback(self.post_export_result)
+        
+    def post_export_result(self, future):
+        """Hand a finished export back to the Tk thread (runs on the worker)"""
+        # Tk widgets may only be touched from the main thread; once the window
+        # has been closed there is no one left to report to
+        self.pending_exports.discard(future)
+        if future.cancelled():
+            return
+        try:
+            self.root.after(0, self.statement_exported, future)
+        except (RuntimeError, tk.TclError):
+            pass
+        
+    def close(self):
+        """Drop queued exports and close the window"""
+        # Cancelled one by one: shutdown(cancel_futures=True) needs Python 3.9+
+        for future in list(self.pending_exports):
+            future.cancel()
+        self.export_executor.shutdown(wait=False)
+        self.root.destroy()
+        
+    def statement_exported(self, future):
+        """Report the outcome of a statement export (runs on the Tk thread)"""
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Export Failed", f"Failed to export PDF: {str(error)}")
+        elif future.result() is None:
+            messagebox.showinfo("No Data", "No transactions to export")
+        else:
+            messagebox.showinfo("Success", 
+                                f"Statement exported successfully!\nSaved as: {future.result()}")
+        
+    def write_statement_pdf(self, account_number, name):
+        """Render the statement PDF and return its filename, or None if there is nothing to export"""
+        # Rows are streamed from the worker's read-only connection instead of loaded into a list
+        transactions = self.bank_system.get_transaction_history_iter(account_number)
+        
+        first = next(transactions, None)
+        if first is None:
+            return None
+        
+        # Create PDF; one clock read names the file and stamps the header
+        generated_at = datetime.now()
+        filename = f"statement_{account_number}_{generated_at.strftime(STATEMENT_FILE_STAMP)}.pdf"
+        c = canvas.Canvas(filename, pagesize=letter)
+        
+        # Header
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(200, 750, "Bank Transaction Statement")
+        
+        c.setFont("Helvetica", 12)
+        c.drawString(50, 720, f"Account Number: {account_number}")
+        c.drawString(50, 700, f"Account Holder: {name}")
+        c.drawString(50, 680, f"Generated: {generated_at.strftime(STATEMENT_TIME_FORMAT)}")
+        
+        type_x = STATEMENT_COLUMNS[0][1]
+        
+        # Table header (column titles + line), stored once as a form XObject
+        # around baseline 0 and drawn by reference at the top of each page
+        c.beginForm("table_header", lowery=-10, uppery=15)
+        c.setFont("Helvetica-Bold", 10)
+        for title, x in STATEMENT_COLUMNS:
+            c.drawString(x, 0, title)
+        # The rule is a fixed moveto/lineto/stroke, written as raw operators
+        c.addLiteral(f"{type_x} -5 m {STATEMENT_RIGHT_EDGE} -5 l S")
+        c.endForm()
+        
+        def draw_table_header(baseline):
+            c.saveState()
+            c.translate(0, baseline)
+            c.doForm("table_header")
+            c.restoreState()
+        
+        y = 640
+        draw_table_header(y)
+        
+        # Turn each row into one fixed-width line ahead of the drawing code; a
+        # lazy map rather than a list so the export stays streamed
+        widths = [(next_x - x) // STATEMENT_CHAR_WIDTH 
+                  for (_, x), (_, next_x) in zip(STATEMENT_COLUMNS, STATEMENT_COLUMNS[1:])]
+        # Each field is padded one short of its column and followed by a space,
+        # so an oversized value pushes the rest of the line along but never
+        # runs into its neighbour
+        line_format = ("{:<%d} {:<%d} {:<%d} {}" % tuple(w - 1 for w in widths)).format
+        
+        def display_row(trans):
+            trans_type, amount, balance_after, trans_date = trans
+            line = line_format(trans_type, format_money(amount), format_money(balance_after), trans_date)
+            return escapePDF(line.encode(STATEMENT_ENCODING, "replace").decode("latin-1"))
+        
+        rows = map(display_row, itertools.chain((first,), transactions))
+        
+        # Transactions, one text object per page, written as a single block of
+        # PDF operators with one Tj per row. Each page takes a fixed slice of
+        # rows sized from its precomputed baselines, so the inner loop needs
+        # no page-break check.
+        ys = range(y - 25, STATEMENT_BOTTOM_Y - 1, -STATEMENT_ROW_HEIGHT)
+        page_rows = list(itertools.islice(rows, len(ys)))
+        while page_rows:
+            # The font set here carries into the literal text block below
+            c.setFont("Courier", 10)
+            c.addLiteral("\n".join(["BT",
+                                     *(f"1 0 0 1 {type_x} {y} Tm ({row}) Tj" for y, row in zip(ys, page_rows)),
+                                     "ET"]))
             
-        except Exception as e:
-            messagebox.showerror("Export Failed", f"Failed to export PDF: {str(e)}")
+            # Continuation pages repeat the table header at the top of the sheet
+            ys = range(STATEMENT_TOP_Y - 25, STATEMENT_BOTTOM_Y - 1, -STATEMENT_ROW_HEIGHT)
+            page_rows = list(itertools.islice(rows, len(ys)))
+            if page_rows:
+                c.showPage()
+                draw_table_header(STATEMENT_TOP_Y)
+        
+        # ReportLab assembles the whole file in memory and hands it to a
+        # single write() call, so the output needs no extra buffering
+        c.save()
+        
+        return filename
 
 
 if __name__ == "__main__":